@@ -14,32 +14,64 @@ To use:
 from dataclasses import dataclass, field
 from typing import Callable, List, Optional
 import random
-import typing
 import bmesh
 import bpy
 import bpy_extras
 import gpu
 from gpu_extras.batch import batch_for_shader
 import mathutils
+import numpy as np
 
 SOCKET_COLOR = (0, 0.6, 1, 0.1)
 HIGHLIGHTED_COLOR = (0.5, 0.8, 1, 0.3)
 SOCKET_RADIUS = 0.15
 HIGHLIGHTED_RADIUS = 0.2
+# hit tests compare against squared distances
+SOCKET_RADIUS_SQ = SOCKET_RADIUS * SOCKET_RADIUS
 MODULAR_ASSETS_CONTAINER_NAME = "modular_assets"
 SOCKET_OUTPUT_PREFIX = "OUT_"
 SOCKET_IN_PREFIX = "IN_"
 
+# each socket is drawn as an instance of the same sphere, per instance data is read from a float texture
+# every instance uses two consecutive texels, wrapped onto rows so the width stays within the gpu texture size limit
+# the first texel holds the socket position (xyz) and sphere scale (w), the second holds the sphere color
+SOCKET_VERTEX_SHADER = """
+ivec2 instance_texel(int texel)
+{
+    int width = textureSize(instance_data, 0).x;
+    return ivec2(texel % width, texel / width);
+}
+
+void main()
+{
+    vec4 offset_scale = texelFetch(instance_data, instance_texel(gl_InstanceID * 2), 0);
+    instance_color = texelFetch(instance_data, instance_texel(gl_InstanceID * 2 + 1), 0);
+    gl_Position = viewProjectionMatrix * vec4(pos * offset_scale.w + offset_scale.xyz, 1.0);
+}
+"""
+
+SOCKET_FRAGMENT_SHADER = """
+void main()
+{
+    fragColor = instance_color;
+}
+"""
+
 @dataclass(slots=True)
 class ModularAssetData:
     """
     ModularAssets contain the information necessary to create a collection instance at a socket.
     You can think of the in_socket as the origin from where an asset will be spawned.
     The out sockets are the local space transforms that determine where the next modules can be spawned.
+    The inverse of the in_socket is cached since it is needed every time the asset is spawned.
     """
     collection:bpy.types.Collection
     in_socket:mathutils.Matrix = mathutils.Matrix.Identity(4)
     out_sockets:list[mathutils.Matrix] = field(default_factory=list)
+    in_socket_inv:mathutils.Matrix = field(init=False)
+
+    def __post_init__(self):
+        self.in_socket_inv = self.in_socket.inverted_safe()
 
 @dataclass(slots=True)
 class SocketData:
@@ -48,11 +80,15 @@ class SocketData:
     They contain a world space transform as well as a list of child sockets.
     You can think of sockets as nodes in a graph.
     Given a root socket, you can traverse the graph to all connected sockets.
+    The world space position is cached from the transform when the socket is created.
     """
     transform:mathutils.Matrix = mathutils.Matrix.Identity(4)
-    is_highlighted:bool = field(default=False, init=True)
     out_sockets:List['SocketData'] = field(default_factory=list)
     collection_instance:Optional[bpy.types.Object] = None
+    position:mathutils.Vector = field(init=False)
+
+    def __post_init__(self):
+        self.position = self.transform.to_translation()
 
 def create_modular_asset_from_collection(collection:bpy.types.Collection) -> ModularAssetData:
     """
@@ -65,13 +101,19 @@ def create_modular_asset_from_collection(collection:bpy.types.Collection) -> Mod
     Returns:
         ModularAssetData: The newly created modular asset containing information for the in and out socket transforms
     """
-    in_socket_objects = {obj.name: obj for obj in collection.objects if obj.name.startswith(SOCKET_IN_PREFIX)}
+    in_socket:Optional[mathutils.Matrix] = None
+    out_sockets:List[mathutils.Matrix] = []
+    for obj in collection.objects:
+        name = obj.name
+        if name.startswith(SOCKET_IN_PREFIX):
+            # only the first in socket is used
+            if in_socket is None:
+                in_socket = obj.matrix_local
+        elif name.startswith(SOCKET_OUTPUT_PREFIX):
+            out_sockets.append(obj.matrix_local)
     # if no socket is found the default is the collection's pivot
-    in_socket = mathutils.Matrix.Identity(4)
-    if in_socket_objects:
-        in_socket = list(in_socket_objects.values())[0].matrix_local
-    out_socket_objects = {obj.name: obj for obj in collection.objects if obj.name.startswith(SOCKET_OUTPUT_PREFIX)}
-    out_sockets = [value.matrix_local for value in out_socket_objects.values()]
+    if in_socket is None:
+        in_socket = mathutils.Matrix.Identity(4)
     return ModularAssetData(collection = collection, in_socket = in_socket, out_sockets = out_sockets)
 
 def create_instance_at_socket(socket:SocketData, modular_asset:ModularAssetData) -> bpy.types.Object:
@@ -85,7 +127,7 @@ def create_instance_at_socket(socket:SocketData, modular_asset:ModularAssetData)
     Returns:
         bpy.types.Object: A reference to the created instance.
     """
-    instance_transform:mathutils.Matrix = socket.transform @ modular_asset.in_socket.inverted_safe()
+    instance_transform:mathutils.Matrix = socket.transform @ modular_asset.in_socket_inv
     instance = bpy.data.objects.new(modular_asset.collection.name, None)
     instance.instance_type = "COLLECTION"
     bpy.context.collection.objects.link(instance)
@@ -105,8 +147,9 @@ def create_sockets_from_modular_asset(world_transform:mathutils.Matrix, modular_
     Returns:
         List[SocketData]: Newly created out sockets positioned in world space.
     """
-    pivot = modular_asset.in_socket.inverted_safe()
-    sockets = [SocketData(world_transform @ pivot @ local_transform) for local_transform in modular_asset.out_sockets]
+    # the asset pivot in world space is shared by every out socket
+    base_transform = world_transform @ modular_asset.in_socket_inv
+    sockets = [SocketData(base_transform @ local_transform) for local_transform in modular_asset.out_sockets]
     return sockets
 
 def does_socket_have_instance(socket:SocketData) -> bool:
@@ -120,39 +163,125 @@ def does_socket_have_instance(socket:SocketData) -> bool:
     """
     return socket.collection_instance is not None
 
-def draw_callback(self, uv_sphere_verts:List[mathutils.Vector]):
-    if self.root_socket is None:
-        return
+def get_socket_positions(sockets:List[SocketData]) -> np.ndarray:
+    """
+    Gather the world space translation of each socket into a single array.
 
-    shader:typing.Any = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
-    gpu.state.depth_test_set('LESS_EQUAL')
+    Args:
+        sockets (List[SocketData]): The sockets to read translations from.
 
-    def draw_socket(socket:SocketData):
-        if does_socket_have_instance(socket):
-            return
+    Returns:
+        np.ndarray: An (N, 3) float32 array of socket positions, in the same order as the provided sockets.
+    """
+    translations = (c for socket in sockets for c in socket.position)
+    return np.fromiter(translations, dtype=np.float32, count=len(sockets) * 3).reshape(-1, 3)
 
-        scale = HIGHLIGHTED_RADIUS if socket.is_highlighted else SOCKET_RADIUS
-        sphere_verts = [socket.transform.to_translation() + (v * scale) for v in uv_sphere_verts]
-        batch:gpu.types.GPUBatch = batch_for_shader(shader, 'TRIS', {"pos": sphere_verts})
+def create_uv_sphere_verts() -> np.ndarray:
+    """
+    Triangulate the built-in uv sphere to draw for each socket.
 
-        color = HIGHLIGHTED_COLOR if socket.is_highlighted else SOCKET_COLOR
-        shader.uniform_float("color", color)
-        batch.draw(shader)
+    Returns:
+        np.ndarray: A (V, 3) float32 array of unit sphere triangle vertices.
+    """
+    new_bmesh:bmesh.types.BMesh = bmesh.new()
+    try:
+        bmesh.ops.create_uvsphere(new_bmesh, u_segments= 6, v_segments=4, radius=1)
+        bmesh.ops.triangulate(new_bmesh, faces = new_bmesh.faces)
+        return np.array([v.co[:] for f in new_bmesh.faces for v in f.verts], dtype=np.float32)
+    finally:
+        # bmesh data lives in blender's allocator and is not released by python's garbage collector
+        new_bmesh.free()
+
+# the sphere never changes so it is only built once per session
+UV_SPHERE_VERTS = create_uv_sphere_verts()
+
+def create_socket_shader() -> gpu.types.GPUShader:
+    """
+    Create the shader used to draw an instanced sphere for every empty socket.
+
+    Returns:
+        gpu.types.GPUShader: The compiled socket shader.
+    """
+    interface = gpu.types.GPUStageInterfaceInfo("socket_interface")
+    interface.flat('VEC4', "instance_color")
+
+    shader_info = gpu.types.GPUShaderCreateInfo()
+    shader_info.push_constant('MAT4', "viewProjectionMatrix")
+    shader_info.sampler(0, 'FLOAT_2D', "instance_data")
+    shader_info.vertex_in(0, 'VEC3', "pos")
+    shader_info.vertex_out(interface)
+    shader_info.fragment_out(0, 'VEC4', "fragColor")
+    shader_info.vertex_source(SOCKET_VERTEX_SHADER)
+    shader_info.fragment_source(SOCKET_FRAGMENT_SHADER)
+    return gpu.shader.create_from_info(shader_info)
+
+def create_instance_texture(socket_positions:np.ndarray, free_sockets:np.ndarray, highlighted_index:int) -> tuple[Optional[gpu.types.GPUTexture], int]:
+    """
+    Pack the per instance data of every empty socket into a texture read by the socket shader.
 
-    for_each_socket(self.root_socket, draw_socket)
+    Args:
+        socket_positions (np.ndarray): The (N, 3) world space positions of all sockets.
+        free_sockets (np.ndarray): An (N,) mask of the sockets that don't have an instance yet.
+        highlighted_index (int): The index of the highlighted socket, or -1 if no socket is highlighted.
+
+    Returns:
+        tuple[Optional[gpu.types.GPUTexture], int]: The instance texture, or None if there is nothing to draw, and the instance count.
+    """
+    instance_count = int(free_sockets.sum())
+    if instance_count == 0:
+        return None, 0
+
+    is_highlighted = np.zeros(len(free_sockets), dtype=bool)
+    if highlighted_index >= 0:
+        is_highlighted[highlighted_index] = True
+    is_highlighted = is_highlighted[free_sockets]
+
+    # wrap the texels onto as many rows as needed, the last row is padded
+    texel_count = instance_count * 2
+    width = min(texel_count, gpu.capabilities.max_texture_size_get())
+    height = -(-texel_count // width)
+    instance_data = np.zeros((width * height, 4), dtype=np.float32)
+    instance_data[0:texel_count:2, :3] = socket_positions[free_sockets]
+    instance_data[0:texel_count:2, 3] = np.where(is_highlighted, HIGHLIGHTED_RADIUS, SOCKET_RADIUS)
+    instance_data[1:texel_count:2] = np.where(is_highlighted[:, None], HIGHLIGHTED_COLOR, SOCKET_COLOR)
+    instance_texture = gpu.types.GPUTexture((width, height), format='RGBA32F',
+                                            data=gpu.types.Buffer('FLOAT', instance_data.size, instance_data.ravel()))
+    return instance_texture, instance_count
+
+def draw_callback(self, shader:gpu.types.GPUShader, sphere_batch:gpu.types.GPUBatch):
+    if self.root_socket is None:
+        return
+
+    # the instance data only changes when sockets are spawned, cycled or highlighted
+    # positions are in world space so camera movement can reuse the cached texture
+    if self.instances_dirty:
+        self.instance_texture, self.instance_count = create_instance_texture(self.socket_positions, self.free_sockets, self.highlighted_index)
+        self.instances_dirty = False
+
+    if self.instance_count == 0:
+        return
+
+    gpu.state.depth_test_set('LESS_EQUAL')
+    shader.bind()
+    shader.uniform_float("viewProjectionMatrix", bpy.context.region_data.perspective_matrix)
+    shader.uniform_sampler("instance_data", self.instance_texture)
+    sphere_batch.draw_instanced(shader, instance_count=self.instance_count)
 
 def for_each_socket(socket:SocketData, function:Callable[[SocketData], None]):
     """
-    Recursively iterate over all sockets, executing the provided method on each one.
+    Iterate over all sockets depth first, executing the provided method on each one.
 
     Args:
-        socket (SocketData): The current socket being processed.
+        socket (SocketData): The socket to start from.
         function (Callable[[SocketData], None]): The function to apply to each socket.
     """
-    function(socket)
-    if socket.out_sockets:
-        for socket in socket.out_sockets:
-            for_each_socket(socket, function)
+    stack = [socket]
+    while stack:
+        socket = stack.pop()
+        function(socket)
+        if socket.out_sockets:
+            # reversed so children are visited in order
+            stack.extend(reversed(socket.out_sockets))
 
 class SocketToMeModalOperator(bpy.types.Operator):
     """Click on a socket to spawn a random module. Right click to cycle through module instances"""
@@ -160,75 +289,152 @@ class SocketToMeModalOperator(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
     bl_label = "Socket to me tool"
 
-    __slots__ = ("root_socket", "last_clicked_socket", "modular_assets", "draw_handle")
+    __slots__ = ("root_socket", "last_clicked_socket", "modular_assets", "draw_handle", "sockets", "socket_positions", "free_sockets", "highlighted_socket", "highlighted_index", "asset_indices", "instance_texture", "instance_count", "instances_dirty")
 
     def __init__(self):
         self.root_socket:Optional[SocketData] = None
         self.last_clicked_socket:Optional[SocketData] = None
+        self.highlighted_socket:Optional[SocketData] = None
+        self.highlighted_index:int = -1
         self.modular_assets:List[ModularAssetData]
+        self.asset_indices:dict[bpy.types.Collection, int] = {}
         self.draw_handle = None
+        # flattened copy of the socket graph, only updated when sockets are spawned or replaced
+        self.sockets:List[SocketData] = []
+        self.socket_positions:np.ndarray = np.empty((0, 3), dtype=np.float32)
+        self.free_sockets:np.ndarray = np.empty(0, dtype=bool)
+        # per instance draw data, rebuilt by the draw callback only when marked dirty
+        self.instance_texture:Optional[gpu.types.GPUTexture] = None
+        self.instance_count:int = 0
+        self.instances_dirty:bool = True
+
+    def add_sockets(self, sockets:List[SocketData]):
+        """
+        Append newly spawned sockets to the flattened socket cache.
+
+        Args:
+            sockets (List[SocketData]): The sockets to append.
+        """
+        self.sockets.extend(sockets)
+        self.socket_positions = np.concatenate((self.socket_positions, get_socket_positions(sockets)))
+        is_free = np.fromiter((not does_socket_have_instance(socket) for socket in sockets), dtype=bool, count=len(sockets))
+        self.free_sockets = np.concatenate((self.free_sockets, is_free))
+        self.instances_dirty = True
+
+    def rebuild_sockets(self):
+        """
+        Rebuild the flattened socket cache from the socket graph, used when part of the graph is replaced.
+        """
+        self.sockets = []
+        if self.root_socket is not None:
+            for_each_socket(self.root_socket, self.sockets.append)
+        self.socket_positions = get_socket_positions(self.sockets)
+        self.free_sockets = np.fromiter((not does_socket_have_instance(socket) for socket in self.sockets), dtype=bool, count=len(self.sockets))
+        self.instances_dirty = True
 
     def modal(self, context, event):
-        context.area.tag_redraw()
-
         if event.type in {'ESC'} or self.root_socket is None:
             bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle, 'WINDOW')
+            context.area.tag_redraw()
             return {'CANCELLED'}
 
-        # camera location and camera to mouse ray
-        world_space_mouse_position:mathutils.Vector = bpy_extras.view3d_utils.region_2d_to_location_3d(context.region, 
-                                                                                                       context.space_data.region_3d, 
-                                                                                                       (event.mouse_region_x, event.mouse_region_y), mathutils.Vector())
-        camera_view_position:mathutils.Vector = context.space_data.region_3d.view_matrix.inverted().translation
-        camera_through_mouse_position_ray:mathutils.Vector = (world_space_mouse_position - camera_view_position).normalized()
-        
-        # find the closest socket by projecting the camera to object ray to get the closest point along that ray to the object
-        # then do a distance check to see if we are within the radius of the object
-        closest_socket:Optional[SocketData] = None
-        closest_length:float = -1.0
-        def find_closest_socket_to_mouse_ray(socket:SocketData):
-            nonlocal closest_socket, closest_length
-            # don't include sockets that already have an instance
-            if does_socket_have_instance(socket):
-                return
-            socket.is_highlighted = False
-            socket_position = socket.transform.to_translation()
-            socket_to_camera_ray = (socket_position - camera_view_position)
-            projected_vector = socket_to_camera_ray.project(camera_through_mouse_position_ray)
-            length_squared = (socket_position - (camera_view_position + projected_vector)).length_squared
-
-            if length_squared < SOCKET_RADIUS and length_squared > closest_length:
-                closest_socket = socket
-                closest_length = length_squared
-    
-        for_each_socket(self.root_socket, find_closest_socket_to_mouse_ray)
-
-        if closest_socket is not None:
-            closest_socket.is_highlighted = True
+        # other events don't need a hit test, left clicks redo it in case the view changed
+        if event.type not in {'MOUSEMOVE', 'LEFTMOUSE', 'RIGHTMOUSE'}:
+            return {'PASS_THROUGH'}
+
+        if event.type in {'MOUSEMOVE'}:
+            self.update_highlight(context, event)
+            return {'PASS_THROUGH'}
 
         if event.type in {'LEFTMOUSE'}:
-            if event.value == 'PRESS' and  closest_socket is not None:
-                random_module = random.choice(self.modular_assets)
-                closest_socket.collection_instance = create_instance_at_socket(closest_socket, random_module)
-                closest_socket.out_sockets = create_sockets_from_modular_asset(closest_socket.transform, random_module)
-                self.last_clicked_socket = closest_socket
-                return {'RUNNING_MODAL'}
+            if event.value == 'PRESS':
+                # the view may have changed without a mouse move (zoom, numpad views), so redo the hit test
+                self.update_highlight(context, event)
+                if self.highlighted_socket is not None:
+                    clicked_socket = self.highlighted_socket
+                    random_module = random.choice(self.modular_assets)
+                    clicked_socket.collection_instance = create_instance_at_socket(clicked_socket, random_module)
+                    clicked_socket.out_sockets = create_sockets_from_modular_asset(clicked_socket.transform, random_module)
+                    self.free_sockets[self.highlighted_index] = False
+                    self.add_sockets(clicked_socket.out_sockets)
+                    # the clicked socket is no longer selectable
+                    self.set_highlighted_socket(-1)
+                    self.last_clicked_socket = clicked_socket
+                    context.area.tag_redraw()
+                    return {'RUNNING_MODAL'}
 
         # cycles through available modules
         if event.type in {'RIGHTMOUSE'}:
             if event.value == 'PRESS' and self.last_clicked_socket and self.last_clicked_socket.collection_instance:
                 last_instance = self.last_clicked_socket.collection_instance.instance_collection
-                index_of = next((i for (i, asset) in enumerate(self.modular_assets) if asset.collection is last_instance), 0)
+                index_of = self.asset_indices.get(last_instance, 0)
                 next_index = (index_of + 1) % len(self.modular_assets)
                 random_module = self.modular_assets[next_index]
 
                 self.last_clicked_socket.collection_instance.instance_collection = random_module.collection
-                self.last_clicked_socket.collection_instance.matrix_world = self.last_clicked_socket.transform @ random_module.in_socket.inverted_safe()
+                self.last_clicked_socket.collection_instance.matrix_world = self.last_clicked_socket.transform @ random_module.in_socket_inv
                 self.last_clicked_socket.out_sockets = create_sockets_from_modular_asset(self.last_clicked_socket.transform, random_module)
+                # rebuilding the socket cache invalidates the highlighted index
+                self.set_highlighted_socket(-1)
+                self.rebuild_sockets()
+                context.area.tag_redraw()
                 return {'RUNNING_MODAL'}
 
         return {'PASS_THROUGH'}
 
+    def find_closest_socket_index(self, context, event) -> int:
+        """
+        Find the empty socket closest to the ray cast from the camera through the mouse position.
+
+        Returns:
+            int: The index of the closest socket in the socket cache, or -1 if no socket is under the mouse.
+        """
+        # camera location and camera to mouse ray
+        world_space_mouse_position:mathutils.Vector = bpy_extras.view3d_utils.region_2d_to_location_3d(context.region, 
+                                                                                                       context.space_data.region_3d, 
+                                                                                                       (event.mouse_region_x, event.mouse_region_y), mathutils.Vector())
+        camera_view_position:mathutils.Vector = context.space_data.region_3d.view_matrix.inverted().translation
+        camera_through_mouse_position_ray:mathutils.Vector = (world_space_mouse_position - camera_view_position).normalized()
+        
+        # find the closest socket by projecting the camera to object ray onto the mouse ray
+        # then do a distance check to see if we are within the radius of the object
+        # the ray is normalized so by pythagoras the squared distance to the ray is |v|^2 - (v.d)^2
+        # this subtracts two large, nearly equal values far from the camera, so it is done in float64
+        ray_origin = np.array(camera_view_position, dtype=np.float64)
+        ray_direction = np.array(camera_through_mouse_position_ray, dtype=np.float64)
+        socket_to_camera_rays = self.socket_positions.astype(np.float64) - ray_origin
+        projected_lengths = socket_to_camera_rays @ ray_direction
+        lengths_squared = (socket_to_camera_rays * socket_to_camera_rays).sum(axis=1) - projected_lengths * projected_lengths
+        # rounding can push sockets on the ray slightly below zero
+        lengths_squared = np.maximum(lengths_squared, 0.0)
+        # don't include sockets that already have an instance
+        lengths_squared = np.where(self.free_sockets & (lengths_squared < SOCKET_RADIUS_SQ), lengths_squared, np.inf)
+
+        if lengths_squared.size == 0:
+            return -1
+        closest_index = int(np.argmin(lengths_squared))
+        return closest_index if np.isfinite(lengths_squared[closest_index]) else -1
+
+    def update_highlight(self, context, event):
+        """
+        Highlight the socket under the mouse, redrawing the viewport only when the highlighted socket changes.
+        """
+        closest_index = self.find_closest_socket_index(context, event)
+        if closest_index != self.highlighted_index:
+            self.set_highlighted_socket(closest_index)
+            context.area.tag_redraw()
+
+    def set_highlighted_socket(self, index:int):
+        """
+        Move the highlight to the socket at the given index of the socket cache.
+
+        Args:
+            index (int): The index of the socket to highlight, or -1 to clear the highlight.
+        """
+        self.highlighted_index = index
+        self.highlighted_socket = self.sockets[index] if index >= 0 else None
+        self.instances_dirty = True
+
     def invoke(self, context, event):
         if context.area.type == 'VIEW_3D':            
             # initilize modular assets
@@ -237,12 +443,12 @@ class SocketToMeModalOperator(bpy.types.Operator):
                 print(f'Could not find assets to instance. Create a parent collection named {MODULAR_ASSETS_CONTAINER_NAME} and put all modular asset collections inside it')
                 return {'CANCELLED'}
             self.modular_assets = [create_modular_asset_from_collection(collection) for collection in modular_asset_container.children]
+            # lets right click find the current module without searching the asset list
+            self.asset_indices = {asset.collection: index for index, asset in enumerate(self.modular_assets)}
 
-            # triangulate the built-in uv sphere to draw for each socket
-            new_bmesh:bmesh.types.BMesh = bmesh.new()
-            bmesh.ops.create_uvsphere(new_bmesh, u_segments= 6, v_segments=4, radius=1)
-            bmesh.ops.triangulate(new_bmesh, faces = new_bmesh.faces)
-            uv_sphere_verts = [mathutils.Vector(v.co.to_tuple()) for f in new_bmesh.faces for v in f.verts]
+            # the sphere is uploaded once, every socket draws an instance of it
+            shader = create_socket_shader()
+            sphere_batch:gpu.types.GPUBatch = batch_for_shader(shader, 'TRIS', {"pos": UV_SPHERE_VERTS})
 
             # spawn starting module
             self.root_socket = SocketData(mathutils.Matrix.Identity(4))
@@ -250,9 +456,10 @@ class SocketToMeModalOperator(bpy.types.Operator):
             self.root_socket.collection_instance = create_instance_at_socket(self.root_socket, start_module)
             self.root_socket.out_sockets = create_sockets_from_modular_asset(self.root_socket.transform, start_module)
             self.last_clicked_socket = self.root_socket
+            self.rebuild_sockets()
             
             # setup draw handler
-            self.draw_handle = bpy.types.SpaceView3D.draw_handler_add(draw_callback, (self, uv_sphere_verts), 'WINDOW', 'POST_VIEW')
+            self.draw_handle = bpy.types.SpaceView3D.draw_handler_add(draw_callback, (self, shader, sphere_batch), 'WINDOW', 'POST_VIEW')
 
             context.window_manager.modal_handler_add(self)
 